@@ -1,13 +1,42 @@
 import json
+import logging
 import boto3
 import os
+import time
+from collections import deque
 from datetime import datetime
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 
-# Initialize AWS services
-dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'))
-s3 = boto3.client('s3', endpoint_url=os.environ.get('S3_ENDPOINT'))
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Initialize AWS services; keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=10,
+                     retries={'mode': 'standard'})
+dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'),
+                          config=boto_config)
+s3 = boto3.client('s3', endpoint_url=os.environ.get('S3_ENDPOINT'), config=boto_config)
 sessions_table = dynamodb.Table('causal-analysis-dev-sessions')
-jobs_table = dynamodb.Table('causal-analysis-dev-jobs')
+
+# Serializer for the low-level transact_write_items call
+serializer = TypeSerializer()
+
+# DynamoDB expression fragments, built once per container
+CTX_NAMES = {'#ctx': 'context'}
+SESSION_UPDATE_EXPR = 'SET #ctx = :context, updatedAt = :timestamp'
+JOB_STATUS_NAMES = {'#s': 'status'}
+JOB_UPDATE_EXPR = 'SET #s = :status, completedAt = :timestamp'
 
 def handler(event, context):
     """
@@ -20,21 +49,26 @@ def handler(event, context):
     Output:
         - Updated context with tool results
     """
-    print(f"Event: {json.dumps(event)}")
+    # Lazy debug logging: the event is only serialized when DEBUG is enabled
+    logger.debug("Event: %s", event)
     
     try:
         session_id = event['sessionId']
         tool_output = event.get('toolOutput', {})
         
-        # Get current session context
-        session_response = sessions_table.get_item(Key={'sessionId': session_id})
-        session_data = session_response.get('Item', {})
-        conversation_context = session_data.get('context', {})
-        
-        # Initialize history if not present
-        if 'history' not in conversation_context:
-            conversation_context['history'] = []
+        # Get current session context (project only the context attribute
+        # so large session records don't inflate the response)
+        session_response = sessions_table.get_item(
+            Key={'sessionId': session_id},
+            ProjectionExpression='#ctx',
+            ExpressionAttributeNames=CTX_NAMES
+        )
+        conversation_context = session_response.get('Item', {}).get('context', {})
         
+        # Bounded history: a maxlen deque evicts the oldest entry in O(1)
+        # instead of re-slicing the list on every overflow
+        history = deque(conversation_context.get('history', []), maxlen=10)
+
         # Format tool output for context
         tool_summary = {
             'role': 'tool',
@@ -64,41 +98,52 @@ def handler(event, context):
             # Generic tool output
             tool_summary['results'] = tool_output.get('results', {})
         
-        # Append to history
-        conversation_context['history'].append(tool_summary)
-        
-        # Keep only last 10 interactions to manage context size
-        if len(conversation_context['history']) > 10:
-            conversation_context['history'] = conversation_context['history'][-10:]
-        
-        # Update session
-        sessions_table.update_item(
-            Key={'sessionId': session_id},
-            UpdateExpression='SET #ctx = :context, updatedAt = :timestamp',
-            ExpressionAttributeNames={'#ctx': 'context'},
-            ExpressionAttributeValues={
-                ':context': conversation_context,
-                ':timestamp': int(datetime.now().timestamp() * 1000)
+        # Append to history (keeps only the last 10 interactions)
+        history.append(tool_summary)
+        conversation_context['history'] = list(history)
+
+        # Serialize results once (compact — the prompt is consumed by the
+        # LLM, not read by humans) and timestamp once for both updates
+        results_json = _dumps(tool_summary['results'])
+        now_ms = int(time.time() * 1000)
+
+        # Update session, and job status if a job ID is present, in one
+        # transactional round-trip instead of two sequential update_item calls
+        timestamp_attr = {'N': str(now_ms)}
+        transact_items = [{
+            'Update': {
+                'TableName': 'causal-analysis-dev-sessions',
+                'Key': {'sessionId': {'S': session_id}},
+                'UpdateExpression': SESSION_UPDATE_EXPR,
+                'ExpressionAttributeNames': CTX_NAMES,
+                'ExpressionAttributeValues': {
+                    ':context': serializer.serialize(conversation_context),
+                    ':timestamp': timestamp_attr
+                }
             }
-        )
-        
-        # Update job status if job ID is present
+        }]
+
         if 'jobId' in tool_output:
-            jobs_table.update_item(
-                Key={'jobId': tool_output['jobId']},
-                UpdateExpression='SET #s = :status, completedAt = :timestamp',
-                ExpressionAttributeNames={'#s': 'status'},
-                ExpressionAttributeValues={
-                    ':status': 'completed',
-                    ':timestamp': int(datetime.now().timestamp() * 1000)
+            transact_items.append({
+                'Update': {
+                    'TableName': 'causal-analysis-dev-jobs',
+                    'Key': {'jobId': {'S': tool_output['jobId']}},
+                    'UpdateExpression': JOB_UPDATE_EXPR,
+                    'ExpressionAttributeNames': JOB_STATUS_NAMES,
+                    'ExpressionAttributeValues': {
+                        ':status': {'S': 'completed'},
+                        ':timestamp': timestamp_attr
+                    }
                 }
-            )
-        
+            })
+
+        dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+
         # Prepare prompt for next LLM iteration
         next_prompt = f"""Based on the tool execution results:
 
 Tool: {tool_summary['tool']}
-Results: {json.dumps(tool_summary['results'], indent=2)}
+Results: {results_json}
 
 Please provide the next step or final answer to the user's query."""
         
@@ -110,7 +155,7 @@ Please provide the next step or final answer to the user's query."""
         }
         
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         return {
             'error': str(e),
             'sessionId': event.get('sessionId')
@@ -13,7 +13,7 @@ def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
     Lambda function to handle simple data queries.
     This function executes basic data queries and returns results.
     """
-    logger.info(f"Data query event: {json.dumps(event)}")
+    logger.debug("Data query event: %s", event)
     
     try:
         # Extract parameters from the event
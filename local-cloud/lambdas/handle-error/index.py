@@ -1,13 +1,27 @@
 import json
+import logging
 import boto3
 import os
+import time
 from datetime import datetime
+from botocore.config import Config
 
-# Initialize AWS services
-dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'))
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Initialize AWS services; keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=10,
+                     retries={'mode': 'standard'})
+dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'),
+                          config=boto_config)
 sessions_table = dynamodb.Table('causal-analysis-dev-sessions')
 connections_table = dynamodb.Table('causal-analysis-dev-connections')
 
+# DynamoDB expression fragments, built once per container
+CTX_NAMES = {'#ctx': 'context'}
+ERROR_UPDATE_EXPR = 'SET #ctx.error = :error, #ctx.errorAt = :timestamp, updatedAt = :timestamp'
+
 def handler(event, context):
     """
     Handle errors in the workflow and notify the user.
@@ -20,7 +34,8 @@ def handler(event, context):
     Output:
         - Error response sent to user
     """
-    print(f"Error Event: {json.dumps(event)}")
+    # Lazy debug logging: the event is only serialized when DEBUG is enabled
+    logger.debug("Error Event: %s", event)
     
     try:
         session_id = event.get('sessionId')
@@ -39,7 +54,7 @@ def handler(event, context):
         error_response = {
             'action': 'error',
             'sessionId': session_id,
-            'messageId': f"err-{int(datetime.now().timestamp())}",
+            'messageId': f"err-{int(time.time())}",
             'error': {
                 'type': error_type,
                 'message': error_message,
@@ -57,37 +72,47 @@ def handler(event, context):
         if session_id:
             sessions_table.update_item(
                 Key={'sessionId': session_id},
-                UpdateExpression='SET #ctx.error = :error, #ctx.errorAt = :timestamp, updatedAt = :timestamp',
-                ExpressionAttributeNames={'#ctx': 'context'},
+                UpdateExpression=ERROR_UPDATE_EXPR,
+                ExpressionAttributeNames=CTX_NAMES,
                 ExpressionAttributeValues={
                     ':error': error_response['error'],
-                    ':timestamp': int(datetime.now().timestamp() * 1000)
-                }
+                    ':timestamp': int(time.time() * 1000)
+                },
+                ReturnValues='NONE'
             )
         
         # Send error to user connections
         if user_id:
+            # Only the connection id is needed, so project just that key
+            # field instead of returning full connection records
             response = connections_table.query(
                 IndexName='userId-index',
                 KeyConditionExpression='userId = :userId',
-                ExpressionAttributeValues={':userId': user_id}
+                ExpressionAttributeValues={':userId': user_id},
+                ProjectionExpression='connectionId',
+                Select='SPECIFIC_ATTRIBUTES'
             )
             
             connections = response.get('Items', [])
-            
-            for connection in connections:
-                connection_id = connection['connectionId']
+
+            if connections:
+                # Store for WebSocket server; batch_writer packs up to 25
+                # puts per request and retries unprocessed items, instead
+                # of one round-trip per connection
+                now_ms = int(time.time() * 1000)
                 try:
-                    # Store for WebSocket server
-                    dynamodb.Table('causal-analysis-dev-pending-messages').put_item(
-                        Item={
-                            'connectionId': connection_id,
-                            'message': error_response,
-                            'timestamp': int(datetime.now().timestamp() * 1000)
-                        }
-                    )
+                    pending_table = dynamodb.Table('causal-analysis-dev-pending-messages')
+                    with pending_table.batch_writer() as batch:
+                        for connection in connections:
+                            batch.put_item(
+                                Item={
+                                    'connectionId': connection['connectionId'],
+                                    'message': error_response,
+                                    'timestamp': now_ms
+                                }
+                            )
                 except Exception as e:
-                    print(f"Failed to send error to connection {connection_id}: {e}")
+                    logger.error("Failed to send error to connections: %s", e)
         
         return {
             'sessionId': session_id,
@@ -96,7 +121,7 @@ def handler(event, context):
         }
         
     except Exception as e:
-        print(f"Error handler failed: {str(e)}")
+        logger.error("Error handler failed: %s", e)
         return {
             'error': 'Error handler failed',
             'details': str(e)
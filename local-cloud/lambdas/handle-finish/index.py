@@ -1,13 +1,72 @@
 import json
+import logging
 import boto3
 import os
+import time
 from datetime import datetime
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=50,
+                     retries={'mode': 'standard'})
 
 # Initialize AWS services
-dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'))
-s3 = boto3.client('s3', endpoint_url=os.environ.get('S3_ENDPOINT'))
+dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'),
+                          config=boto_config)
 sessions_table = dynamodb.Table('causal-analysis-dev-sessions')
 connections_table = dynamodb.Table('causal-analysis-dev-connections')
+pending_messages_table = dynamodb.Table('causal-analysis-dev-pending-messages')
+
+# Serializer for the low-level transact_write_items call
+serializer = TypeSerializer()
+
+# DynamoDB expression fragments, built once per container
+CTX_NAMES = {'#ctx': 'context'}
+SESSION_COMPLETE_UPDATE = 'SET #ctx.completed = :true, #ctx.completedAt = :timestamp, updatedAt = :timestamp'
+USER_INDEX_KCE = 'userId = :userId'
+
+# Short-TTL cache of the userId-index lookup: back-to-back invocations
+# within one Step Functions execution reuse the connection list instead
+# of re-querying the GSI; stale entries age out within the TTL
+_CONN_TTL_SECONDS = 5
+_conn_cache = {}  # user_id -> (connections, fetched_at)
+
+def _get_connections(user_id):
+    """Return the user's active connections, cached briefly per container."""
+    cached = _conn_cache.get(user_id)
+    if cached and time.monotonic() - cached[1] < _CONN_TTL_SECONDS:
+        return cached[0]
+
+    response = connections_table.query(
+        IndexName='userId-index',
+        KeyConditionExpression=USER_INDEX_KCE,
+        ProjectionExpression='connectionId',
+        Select='SPECIFIC_ATTRIBUTES',
+        ExpressionAttributeValues={':userId': user_id}
+    )
+    connections = response.get('Items', [])
+    _conn_cache[user_id] = (connections, time.monotonic())
+    return connections
+
+def _session_complete_update(session_id, now_ms):
+    """Build the transaction entry marking the session completed."""
+    return {
+        'Update': {
+            'TableName': 'causal-analysis-dev-sessions',
+            'Key': {'sessionId': {'S': session_id}},
+            'UpdateExpression': SESSION_COMPLETE_UPDATE,
+            'ExpressionAttributeNames': CTX_NAMES,
+            'ExpressionAttributeValues': {
+                ':true': {'BOOL': True},
+                ':timestamp': {'N': str(now_ms)}
+            }
+        }
+    }
 
 def handler(event, context):
     """
@@ -20,28 +79,42 @@ def handler(event, context):
     Output:
         - Final formatted response sent to user
     """
-    print(f"Event: {json.dumps(event)}")
+    # Lazy debug logging: the event is only serialized when DEBUG is enabled
+    logger.debug("Event: %s", event)
     
     try:
         session_id = event['sessionId']
         llm_response = event.get('llmResponse', {})
+
+        # One clock read per invocation keeps all timestamps aligned
+        now = datetime.now()
+        ts_ms = int(now.timestamp() * 1000)
+        iso = now.isoformat()
         
-        # Get session data
-        session_response = sessions_table.get_item(Key={'sessionId': session_id})
-        session_data = session_response.get('Item', {})
-        user_id = session_data.get('userId')
-        conversation_context = session_data.get('context', {})
+        # The execution input already carries userId, and after a tool
+        # round AppendToolOutput leaves its updated conversation context
+        # at $.context.context — trust the state and fall back to a
+        # session read only when it lacks the data
+        user_id = event.get('userId')
+        state_context = event.get('context')
+        conversation_context = state_context.get('context') if isinstance(state_context, dict) else None
+        if not user_id or conversation_context is None:
+            session_response = sessions_table.get_item(Key={'sessionId': session_id})
+            session_data = session_response.get('Item', {})
+            user_id = user_id or session_data.get('userId')
+            if conversation_context is None:
+                conversation_context = session_data.get('context', {})
         
         # Format final response
         final_response = {
             'action': 'response',
             'sessionId': session_id,
-            'messageId': f"msg-{int(datetime.now().timestamp())}",
+            'messageId': f"msg-{ts_ms // 1000}",
             'payload': {
                 'type': 'final_answer',
                 'content': llm_response.get('content', 'Analysis completed'),
                 'metadata': {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': iso,
                     'executionTime': conversation_context.get('executionTime'),
                     'toolsUsed': [h['tool'] for h in conversation_context.get('history', []) if h.get('role') == 'tool']
                 }
@@ -52,40 +125,51 @@ def handler(event, context):
         if 'artifacts' in conversation_context:
             final_response['payload']['artifacts'] = conversation_context['artifacts']
         
-        # Update session with completion
-        sessions_table.update_item(
-            Key={'sessionId': session_id},
-            UpdateExpression='SET #ctx.completed = :true, #ctx.completedAt = :timestamp, updatedAt = :timestamp',
-            ExpressionAttributeNames={'#ctx': 'context'},
-            ExpressionAttributeValues={
-                ':true': True,
-                ':timestamp': int(datetime.now().timestamp() * 1000)
-            }
-        )
-        
-        # Find user connections
-        response = connections_table.query(
-            IndexName='userId-index',
-            KeyConditionExpression='userId = :userId',
-            ExpressionAttributeValues={':userId': user_id}
-        )
-        
-        connections = response.get('Items', [])
-        
-        # Send final response to all connections
-        for connection in connections:
-            connection_id = connection['connectionId']
-            try:
-                # In local dev, store for WebSocket server to pick up
-                dynamodb.Table('causal-analysis-dev-pending-messages').put_item(
-                    Item={
-                        'connectionId': connection_id,
-                        'message': final_response,
-                        'timestamp': int(datetime.now().timestamp() * 1000)
+        # Find user connections (cached across invocations in a session)
+        connections = _get_connections(user_id)
+
+        # Update the session and queue the broadcast in one transactional
+        # round-trip. With no connections a plain update is cheaper than a
+        # one-item transaction (transactional writes cost double WCU), and
+        # fan-outs past the 25-item transaction limit fall back to
+        # separate writes
+        now_ms = ts_ms
+        if connections and len(connections) <= 24:
+            transact_items = [_session_complete_update(session_id, now_ms)]
+            message_attr = serializer.serialize(final_response)
+            for connection in connections:
+                transact_items.append({
+                    'Put': {
+                        'TableName': 'causal-analysis-dev-pending-messages',
+                        'Item': {
+                            'connectionId': {'S': connection['connectionId']},
+                            'message': message_attr,
+                            'timestamp': {'N': str(now_ms)}
+                        }
                     }
-                )
-            except Exception as e:
-                print(f"Failed to send to connection {connection_id}: {e}")
+                })
+            dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+        else:
+            sessions_table.update_item(
+                Key={'sessionId': session_id},
+                UpdateExpression=SESSION_COMPLETE_UPDATE,
+                ExpressionAttributeNames=CTX_NAMES,
+                ExpressionAttributeValues={
+                    ':true': True,
+                    ':timestamp': now_ms
+                },
+                ReturnValues='NONE'
+            )
+            # In local dev, store for WebSocket server to pick up
+            with pending_messages_table.batch_writer() as batch:
+                for connection in connections:
+                    batch.put_item(
+                        Item={
+                            'connectionId': connection['connectionId'],
+                            'message': final_response,
+                            'timestamp': now_ms
+                        }
+                    )
         
         # Generate summary for logging
         summary = {
@@ -96,12 +180,12 @@ def handler(event, context):
             'connectionsSent': len(connections)
         }
         
-        print(f"Execution completed: {json.dumps(summary)}")
+        logger.info("Execution completed: %s", summary)
         
         return summary
         
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         return {
             'error': str(e),
             'sessionId': event.get('sessionId'),
@@ -1,12 +1,57 @@
 import json
+import logging
 import boto3
 import os
+import time
 from datetime import datetime
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=50,
+                     retries={'mode': 'standard'})
 
 # Initialize AWS services
-dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'))
+dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'),
+                          config=boto_config)
 sessions_table = dynamodb.Table('causal-analysis-dev-sessions')
 connections_table = dynamodb.Table('causal-analysis-dev-connections')
+pending_messages_table = dynamodb.Table('causal-analysis-dev-pending-messages')
+
+# Serializer for the low-level transact_write_items call
+serializer = TypeSerializer()
+
+# DynamoDB expression fragments, built once per container
+CTX_NAMES = {'#ctx': 'context'}
+TIMEOUT_UPDATE_EXPR = 'REMOVE #ctx.pendingTaskToken, #ctx.pendingPrompt SET #ctx.timedOut = :true, updatedAt = :timestamp'
+USER_INDEX_KCE = 'userId = :userId'
+
+# Short-TTL cache of the userId-index lookup: back-to-back invocations
+# within one Step Functions execution reuse the connection list instead
+# of re-querying the GSI; stale entries age out within the TTL
+_CONN_TTL_SECONDS = 5
+_conn_cache = {}  # user_id -> (connections, fetched_at)
+
+def _get_connections(user_id):
+    """Return the user's active connections, cached briefly per container."""
+    cached = _conn_cache.get(user_id)
+    if cached and time.monotonic() - cached[1] < _CONN_TTL_SECONDS:
+        return cached[0]
+
+    response = connections_table.query(
+        IndexName='userId-index',
+        KeyConditionExpression=USER_INDEX_KCE,
+        ProjectionExpression='connectionId',
+        Select='SPECIFIC_ATTRIBUTES',
+        ExpressionAttributeValues={':userId': user_id}
+    )
+    connections = response.get('Items', [])
+    _conn_cache[user_id] = (connections, time.monotonic())
+    return connections
 
 def handler(event, context):
     """
@@ -19,27 +64,35 @@ def handler(event, context):
     Output:
         - Timeout notification sent to user
     """
-    print(f"Timeout Event: {json.dumps(event)}")
+    # Lazy debug logging: the event is only serialized when DEBUG is enabled
+    logger.debug("Timeout Event: %s", event)
     
     try:
         session_id = event.get('sessionId')
         timeout_type = event.get('timeoutType', 'user_response')
+
+        # One clock read per invocation keeps all timestamps aligned
+        now = datetime.now()
+        ts_ms = int(now.timestamp() * 1000)
+        iso = now.isoformat()
         
-        # Get session data
+        # The session read stays: pendingPrompt only exists in the stored
+        # session context (send-prompt writes it there), but userId can
+        # come straight from the execution input
         session_response = sessions_table.get_item(Key={'sessionId': session_id})
         session_data = session_response.get('Item', {})
-        user_id = session_data.get('userId')
+        user_id = event.get('userId') or session_data.get('userId')
         conversation_context = session_data.get('context', {})
         
         # Format timeout response
         timeout_response = {
             'action': 'timeout',
             'sessionId': session_id,
-            'messageId': f"timeout-{int(datetime.now().timestamp())}",
+            'messageId': f"timeout-{ts_ms // 1000}",
             'timeout': {
                 'type': timeout_type,
                 'message': 'The operation timed out. Please try again.',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso
             }
         }
         
@@ -47,41 +100,62 @@ def handler(event, context):
         if timeout_type == 'user_response' and 'pendingPrompt' in conversation_context:
             timeout_response['timeout']['message'] = f"Timed out waiting for response to: {conversation_context['pendingPrompt']}"
         
-        # Clear pending task token
-        sessions_table.update_item(
-            Key={'sessionId': session_id},
-            UpdateExpression='REMOVE #ctx.pendingTaskToken, #ctx.pendingPrompt SET #ctx.timedOut = :true, updatedAt = :timestamp',
-            ExpressionAttributeNames={'#ctx': 'context'},
-            ExpressionAttributeValues={
-                ':true': True,
-                ':timestamp': int(datetime.now().timestamp() * 1000)
-            }
-        )
-        
-        # Send timeout notification
-        if user_id:
-            response = connections_table.query(
-                IndexName='userId-index',
-                KeyConditionExpression='userId = :userId',
-                ExpressionAttributeValues={':userId': user_id}
-            )
-            
-            connections = response.get('Items', [])
-            
+        # Look up connections first, then clear the pending task token and
+        # queue the timeout notification in one transactional round-trip
+        connections = _get_connections(user_id) if user_id else []
+
+        # With no connections a plain update is cheaper than a one-item
+        # transaction (transactional writes cost double WCU)
+        now_ms = ts_ms
+        if connections and len(connections) <= 24:
+            transact_items = [{
+                'Update': {
+                    'TableName': 'causal-analysis-dev-sessions',
+                    'Key': {'sessionId': {'S': session_id}},
+                    'UpdateExpression': TIMEOUT_UPDATE_EXPR,
+                    'ExpressionAttributeNames': CTX_NAMES,
+                    'ExpressionAttributeValues': {
+                        ':true': {'BOOL': True},
+                        ':timestamp': {'N': str(now_ms)}
+                    }
+                }
+            }]
+            message_attr = serializer.serialize(timeout_response)
             for connection in connections:
-                connection_id = connection['connectionId']
-                try:
-                    # Store for WebSocket server
-                    dynamodb.Table('causal-analysis-dev-pending-messages').put_item(
+                transact_items.append({
+                    'Put': {
+                        'TableName': 'causal-analysis-dev-pending-messages',
+                        'Item': {
+                            'connectionId': {'S': connection['connectionId']},
+                            'message': message_attr,
+                            'timestamp': {'N': str(now_ms)}
+                        }
+                    }
+                })
+            dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+        else:
+            # Fan-out too large for one transaction: separate update plus
+            # batched puts (25 per request with unprocessed-item retries)
+            sessions_table.update_item(
+                Key={'sessionId': session_id},
+                UpdateExpression=TIMEOUT_UPDATE_EXPR,
+                ExpressionAttributeNames=CTX_NAMES,
+                ExpressionAttributeValues={
+                    ':true': True,
+                    ':timestamp': now_ms
+                },
+                ReturnValues='NONE'
+            )
+            with pending_messages_table.batch_writer() as batch:
+                for connection in connections:
+                    batch.put_item(
                         Item={
-                            'connectionId': connection_id,
+                            'connectionId': connection['connectionId'],
                             'message': timeout_response,
-                            'timestamp': int(datetime.now().timestamp() * 1000)
+                            'timestamp': now_ms
                         }
                     )
-                except Exception as e:
-                    print(f"Failed to send timeout to connection {connection_id}: {e}")
-        
+
         return {
             'sessionId': session_id,
             'status': 'timeout_handled',
@@ -89,7 +163,7 @@ def handler(event, context):
         }
         
     except Exception as e:
-        print(f"Timeout handler failed: {str(e)}")
+        logger.error("Timeout handler failed: %s", e)
         return {
             'error': 'Timeout handler failed',
             'details': str(e)
@@ -1,33 +1,93 @@
 import json
+import logging
 import boto3
 import os
-import openai
+import time
 from datetime import datetime
+from botocore.config import Config
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=50,
+                     retries={'mode': 'standard'})
 
 # Initialize AWS services
-secrets_client = boto3.client('secretsmanager', endpoint_url=os.environ.get('SECRETS_ENDPOINT'))
-dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'))
+secrets_client = boto3.client('secretsmanager', endpoint_url=os.environ.get('SECRETS_ENDPOINT'),
+                              config=boto_config)
+dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'),
+                          config=boto_config)
 sessions_table = dynamodb.Table('causal-analysis-dev-sessions')
 
+# DynamoDB expression fragments, built once per container
+CTX_NAMES = {'#ctx': 'context'}
+LLM_RESPONSE_UPDATE_EXPR = 'SET #ctx.lastLLMResponse = :response, updatedAt = :timestamp'
+
+# Warm-container cache: the secret and parsed config are refetched at most
+# once per TTL window instead of on every invocation
+_SECRET_TTL_SECONDS = 300
+_openai_config_cache = None  # (config, fetched_at)
+
+# OpenAI client, created once per container: its HTTP/2 connection pool is
+# reused across warm invocations instead of a TLS handshake per call
+_openai_client = None  # (client, api_key)
+
+def get_openai_client(api_key):
+    """Return the shared OpenAI client, rebuilding it only on key change."""
+    global _openai_client
+    if _openai_client is None or _openai_client[1] != api_key:
+        # Imported here so mock-LLM invocations and cold starts on the
+        # mock path never pay for loading the SDK
+        import httpx
+        from openai import OpenAI
+
+        client = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=10)
+            )
+        )
+        _openai_client = (client, api_key)
+    return _openai_client[0]
+
 def get_openai_config():
-    """Retrieve OpenAI configuration from Secrets Manager."""
+    """Retrieve OpenAI configuration from Secrets Manager, cached across
+    warm invocations."""
+    global _openai_config_cache
+    if (_openai_config_cache is not None
+            and time.time() - _openai_config_cache[1] < _SECRET_TTL_SECONDS):
+        return _openai_config_cache[0]
+
     try:
         # Try to get from new secrets structure first
         secret_name = os.environ.get('OPENAI_SECRET_NAME', 'causal-analysis-dev-openai-api-key')
         response = secrets_client.get_secret_value(SecretId=secret_name)
-        secret = json.loads(response['SecretString'])
-        return {
+        secret = _loads(response['SecretString'])
+        config = {
             'api_key': secret.get('api_key'),
             'model': secret.get('model', 'gpt-3.5-turbo')
         }
     except Exception as e:
-        print(f"Error getting OpenAI config from Secrets Manager: {e}")
+        logger.error("Error getting OpenAI config from Secrets Manager: %s", e)
         # Fallback to environment variables for local development
-        return {
+        config = {
             'api_key': os.environ.get('OPENAI_API_KEY', 'test-key'),
             'model': os.environ.get('OPENAI_MODEL', 'gpt-3.5-turbo')
         }
 
+    _openai_config_cache = (config, time.time())
+    return config
+
 def handler(event, context):
     """
     Invoke LLM to process the query and determine next action.
@@ -41,7 +101,8 @@ def handler(event, context):
         - type: "tool_call", "need_input", or "final_answer"
         - content: Response or tool parameters
     """
-    print(f"Event: {json.dumps(event)}")
+    # Lazy debug logging: the event is only serialized when DEBUG is enabled
+    logger.debug("Event: %s", event)
     
     try:
         session_id = event['sessionId']
@@ -82,9 +143,9 @@ def handler(event, context):
                     'content': 'I can help you with causal analysis and exploratory data analysis. What would you like to analyze?'
                 }
         else:
-            # Real LLM call
-            openai.api_key = api_key
-            
+            # Real LLM call through the pooled per-container client
+            client = get_openai_client(api_key)
+
             messages = [
                 {
                     "role": "system",
@@ -100,24 +161,25 @@ def handler(event, context):
             if 'history' in conversation_context:
                 messages = conversation_context['history'] + messages
             
-            completion = openai.ChatCompletion.create(
+            completion = client.chat.completions.create(
                 model=model,
                 messages=messages,
                 temperature=0.7,
                 response_format={"type": "json_object"}
             )
             
-            response = json.loads(completion.choices[0].message.content)
+            response = _loads(completion.choices[0].message.content)
         
         # Update session context
         sessions_table.update_item(
             Key={'sessionId': session_id},
-            UpdateExpression='SET #ctx.lastLLMResponse = :response, updatedAt = :timestamp',
-            ExpressionAttributeNames={'#ctx': 'context'},
+            UpdateExpression=LLM_RESPONSE_UPDATE_EXPR,
+            ExpressionAttributeNames=CTX_NAMES,
             ExpressionAttributeValues={
                 ':response': response,
-                ':timestamp': int(datetime.now().timestamp() * 1000)
-            }
+                ':timestamp': int(time.time() * 1000)
+            },
+            ReturnValues='NONE'
         )
         
         # Add session ID to response
@@ -126,7 +188,7 @@ def handler(event, context):
         return response
         
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         return {
             'type': 'error',
             'error': str(e),
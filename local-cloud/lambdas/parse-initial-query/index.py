@@ -1,12 +1,51 @@
 import json
+import logging
 import boto3
 import os
+import time
 from datetime import datetime
+from botocore.config import Config
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=50,
+                     retries={'mode': 'standard'})
 
 # Initialize AWS services
-dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'))
+dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'),
+                          config=boto_config)
 sessions_table = dynamodb.Table('causal-analysis-dev-sessions')
 
+# DynamoDB expression fragments, built once per container
+CTX_NAMES = {'#ctx': 'context'}
+QUERY_UPDATE_EXPR = 'SET #ctx.lastQuery = :query, updatedAt = :timestamp'
+
+# Cap on how much session context gets embedded in the LLM prompt;
+# beyond this the context is summarized to its most recent turns
+_MAX_CONTEXT_BYTES = 4096
+
+def _context_json(context):
+    """Serialize session context for the prompt, summarizing it to the
+    last few history turns when the full dump would blow up prompt size
+    (and LLM token cost) downstream."""
+    ctx_json = _dumps(context)
+    if len(ctx_json) <= _MAX_CONTEXT_BYTES:
+        return ctx_json
+    history = context.get('history', [])
+    return _dumps({'history_len': len(history), 'last': history[-3:]})
+
 def handler(event, context):
     """
     Parse the initial user query and prepare it for LLM processing.
@@ -18,7 +57,8 @@ def handler(event, context):
     Output:
         - Parsed query with context and metadata
     """
-    print(f"Event: {json.dumps(event)}")
+    # Lazy debug logging: the event is only serialized when DEBUG is enabled
+    logger.debug("Event: %s", event)
     
     try:
         session_id = event['sessionId']
@@ -53,12 +93,12 @@ Respond with a JSON object containing:
 """
             
             prompt = system_prompt.format(
-                context=json.dumps(context),
+                context=_context_json(context),
                 query=content
             )
         else:
             # Structured query - validate and format
-            prompt = json.dumps({
+            prompt = _dumps({
                 "type": "structured_analysis",
                 "parameters": query.get('parameters', {})
             })
@@ -66,12 +106,13 @@ Respond with a JSON object containing:
         # Update session with query
         sessions_table.update_item(
             Key={'sessionId': session_id},
-            UpdateExpression='SET #ctx.lastQuery = :query, updatedAt = :timestamp',
-            ExpressionAttributeNames={'#ctx': 'context'},
+            UpdateExpression=QUERY_UPDATE_EXPR,
+            ExpressionAttributeNames=CTX_NAMES,
             ExpressionAttributeValues={
                 ':query': content,
-                ':timestamp': int(datetime.now().timestamp() * 1000)
-            }
+                ':timestamp': int(time.time() * 1000)
+            },
+            ReturnValues='NONE'
         )
         
         return {
@@ -83,7 +124,7 @@ Respond with a JSON object containing:
         }
         
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         return {
             'error': str(e),
             'statusCode': 500
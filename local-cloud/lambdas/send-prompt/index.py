@@ -1,17 +1,46 @@
 import json
+import logging
 import boto3
 import os
+import time
 from datetime import datetime
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=50,
+                     retries={'mode': 'standard'})
 
 # Initialize AWS services
-dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'))
+dynamodb = boto3.resource('dynamodb', endpoint_url=os.environ.get('DYNAMODB_ENDPOINT'),
+                          config=boto_config)
 connections_table = dynamodb.Table('causal-analysis-dev-connections')
 sessions_table = dynamodb.Table('causal-analysis-dev-sessions')
+pending_messages_table = dynamodb.Table('causal-analysis-dev-pending-messages')
+
+# Serializer for the low-level transact_write_items call
+serializer = TypeSerializer()
+
+# DynamoDB expression fragments, built once per container
+CTX_NAMES = {'#ctx': 'context'}
+PROMPT_UPDATE_EXPR = 'SET #ctx.pendingTaskToken = :token, #ctx.pendingPrompt = :prompt, updatedAt = :timestamp'
+USER_INDEX_KCE = 'userId = :userId'
 
 # For sending messages through API Gateway (in production)
 # In local dev, the WebSocket gateway handles this directly
-api_gateway_client = boto3.client('apigatewaymanagementapi', 
-                                  endpoint_url=os.environ.get('WEBSOCKET_ENDPOINT'))
+api_gateway_client = boto3.client('apigatewaymanagementapi',
+                                  endpoint_url=os.environ.get('WEBSOCKET_ENDPOINT'),
+                                  config=boto_config)
+
+# Built at module scope so the error path can fail the waiting Step
+# Functions task without paying client-construction cost first
+step_functions = boto3.client('stepfunctions',
+                              endpoint_url=os.environ.get('STEP_FUNCTIONS_ENDPOINT'),
+                              config=boto_config)
 
 def handler(event, context):
     """
@@ -25,12 +54,18 @@ def handler(event, context):
     Output:
         - Waits for user response via callback
     """
-    print(f"Event: {json.dumps(event)}")
+    # Lazy debug logging: the event is only serialized when DEBUG is enabled
+    logger.debug("Event: %s", event)
     
     try:
         session_id = event['sessionId']
         prompt = event['prompt']
         task_token = event['taskToken']
+
+        # One clock read per invocation keeps all timestamps aligned
+        now = datetime.now()
+        ts_ms = int(now.timestamp() * 1000)
+        iso = now.isoformat()
         
         # Get session data to find connection
         session_response = sessions_table.get_item(Key={'sessionId': session_id})
@@ -43,7 +78,9 @@ def handler(event, context):
         # Find active connections for user
         response = connections_table.query(
             IndexName='userId-index',
-            KeyConditionExpression='userId = :userId',
+            KeyConditionExpression=USER_INDEX_KCE,
+            ProjectionExpression='connectionId',
+            Select='SPECIFIC_ATTRIBUTES',
             ExpressionAttributeValues={':userId': user_id}
         )
         
@@ -51,43 +88,93 @@ def handler(event, context):
         if not connections:
             raise Exception(f"No active connections for user {user_id}")
         
-        # Store task token for later callback
-        sessions_table.update_item(
-            Key={'sessionId': session_id},
-            UpdateExpression='SET #ctx.pendingTaskToken = :token, #ctx.pendingPrompt = :prompt, updatedAt = :timestamp',
-            ExpressionAttributeNames={'#ctx': 'context'},
-            ExpressionAttributeValues={
-                ':token': task_token,
-                ':prompt': prompt,
-                ':timestamp': int(datetime.now().timestamp() * 1000)
-            }
-        )
-        
         # Send prompt to all active connections
         message = {
             'action': 'prompt',
             'sessionId': session_id,
             'prompt': prompt,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': iso
         }
-        
-        for connection in connections:
-            connection_id = connection['connectionId']
-            try:
-                # In production, this would use API Gateway Management API
-                # For local dev, we'll store this in DynamoDB for the WebSocket server to pick up
-                print(f"Would send to connection {connection_id}: {json.dumps(message)}")
-                
-                # Store pending message (local dev workaround)
-                dynamodb.Table('causal-analysis-dev-pending-messages').put_item(
-                    Item={
-                        'connectionId': connection_id,
-                        'message': message,
-                        'timestamp': int(datetime.now().timestamp() * 1000)
+
+        now_ms = ts_ms
+        if os.environ.get('STAGE', 'local') != 'local':
+            # Production: push frames straight through the API Gateway
+            # Management API — no pending-messages hop, no polling delay
+            sessions_table.update_item(
+                Key={'sessionId': session_id},
+                UpdateExpression=PROMPT_UPDATE_EXPR,
+                ExpressionAttributeNames=CTX_NAMES,
+                ExpressionAttributeValues={
+                    ':token': task_token,
+                    ':prompt': prompt,
+                    ':timestamp': now_ms
+                },
+                ReturnValues='NONE'
+            )
+            payload = json.dumps(message).encode()
+            for connection in connections:
+                connection_id = connection['connectionId']
+                try:
+                    api_gateway_client.post_to_connection(
+                        ConnectionId=connection_id,
+                        Data=payload
+                    )
+                except api_gateway_client.exceptions.GoneException:
+                    # The client went away: prune the stale connection so
+                    # later broadcasts skip it
+                    connections_table.delete_item(Key={'connectionId': connection_id})
+        # Local dev: store the task token and queue the prompt for every
+        # connection in one transactional round-trip for the WebSocket
+        # server to pick up; fall back to separate writes when the fan-out
+        # would exceed the 25-item transaction limit
+        elif len(connections) <= 24:
+            transact_items = [{
+                'Update': {
+                    'TableName': 'causal-analysis-dev-sessions',
+                    'Key': {'sessionId': {'S': session_id}},
+                    'UpdateExpression': PROMPT_UPDATE_EXPR,
+                    'ExpressionAttributeNames': CTX_NAMES,
+                    'ExpressionAttributeValues': {
+                        ':token': {'S': task_token},
+                        ':prompt': {'S': prompt},
+                        ':timestamp': {'N': str(now_ms)}
                     }
-                )
-            except Exception as e:
-                print(f"Failed to send to connection {connection_id}: {e}")
+                }
+            }]
+            message_attr = serializer.serialize(message)
+            for connection in connections:
+                transact_items.append({
+                    'Put': {
+                        'TableName': 'causal-analysis-dev-pending-messages',
+                        'Item': {
+                            'connectionId': {'S': connection['connectionId']},
+                            'message': message_attr,
+                            'timestamp': {'N': str(now_ms)}
+                        }
+                    }
+                })
+            dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+        else:
+            sessions_table.update_item(
+                Key={'sessionId': session_id},
+                UpdateExpression=PROMPT_UPDATE_EXPR,
+                ExpressionAttributeNames=CTX_NAMES,
+                ExpressionAttributeValues={
+                    ':token': task_token,
+                    ':prompt': prompt,
+                    ':timestamp': now_ms
+                },
+                ReturnValues='NONE'
+            )
+            with pending_messages_table.batch_writer() as batch:
+                for connection in connections:
+                    batch.put_item(
+                        Item={
+                            'connectionId': connection['connectionId'],
+                            'message': message,
+                            'timestamp': now_ms
+                        }
+                    )
         
         # This Lambda returns immediately
         # The actual response will come via callback when user responds
@@ -98,11 +185,8 @@ def handler(event, context):
         }
         
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         # Send error callback to Step Functions
-        step_functions = boto3.client('stepfunctions', 
-                                      endpoint_url=os.environ.get('STEP_FUNCTIONS_ENDPOINT'))
-        
         if 'taskToken' in event:
             try:
                 step_functions.send_task_failure(
@@ -110,8 +194,8 @@ def handler(event, context):
                     error='PromptError',
                     cause=str(e)
                 )
-            except:
-                pass
+            except Exception:
+                logger.exception("send_task_failure failed")
         
         return {
             'error': str(e),
@@ -1,23 +1,56 @@
 import json
-import jwt
 import boto3
 import os
+import time
 import logging
 from typing import Dict, Any, Optional
+from botocore.config import Config
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# AWS clients
-cognito_client = boto3.client('cognito-idp')
-secrets_client = boto3.client('secretsmanager')
+# AWS clients; keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=50,
+                     retries={'mode': 'standard'})
+cognito_client = boto3.client('cognito-idp', config=boto_config)
+secrets_client = boto3.client('secretsmanager', config=boto_config)
 
 # Configuration
 USER_POOL_ID = os.environ.get('USER_POOL_ID')
 USER_POOL_CLIENT_ID = os.environ.get('USER_POOL_CLIENT_ID')
 JWT_SECRET_ARN = os.environ.get('JWT_SECRET_ARN')
 
+AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+COGNITO_ISSUER = f"https://cognito-idp.{AWS_REGION}.amazonaws.com/{USER_POOL_ID}"
+
+# Cognito JWKS client: the user pool's public keys are fetched once per
+# container (and on unknown key ids), letting tokens be verified locally
+# instead of calling get_user on every $connect
+_jwks_client = None
+
+def get_jwks_client() -> "jwt.PyJWKClient":
+    import jwt
+    global _jwks_client
+    if _jwks_client is None:
+        _jwks_client = jwt.PyJWKClient(f"{COGNITO_ISSUER}/.well-known/jwks.json")
+    return _jwks_client
+
+# Warm-container cache for Secrets Manager lookups: SecretId -> (value, fetched_at)
+_SECRET_TTL_SECONDS = 300
+_secret_cache: Dict[str, Any] = {}
+
+def get_cached_secret(secret_id: str) -> str:
+    """Return the secret string, refetching at most once per TTL window."""
+    cached = _secret_cache.get(secret_id)
+    if cached and time.time() - cached[1] < _SECRET_TTL_SECONDS:
+        return cached[0]
+
+    response = secrets_client.get_secret_value(SecretId=secret_id)
+    value = response['SecretString']
+    _secret_cache[secret_id] = (value, time.time())
+    return value
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     WebSocket Lambda Authorizer for $connect route
@@ -28,7 +61,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns an IAM policy allowing or denying the connection.
     """
     try:
-        logger.info(f"Authorizer event: {json.dumps(event, default=str)}")
+        logger.debug("Authorizer event: %s", event)
         
         # Extract the token from various possible locations
         token = extract_token(event)
@@ -122,14 +155,57 @@ def validate_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 def validate_cognito_token(token: str) -> Optional[Dict[str, Any]]:
-    """Validate Cognito JWT token."""
+    """Validate Cognito JWT token against the pool's public JWKS locally,
+    falling back to the get_user API only when local verification is
+    unavailable."""
+    # PyJWT (and its cryptography backend) load lazily so deny-fast paths
+    # never pay the import cost
+    import jwt
+
+    try:
+        signing_key = get_jwks_client().get_signing_key_from_jwt(token)
+        claims = jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=['RS256'],
+            issuer=COGNITO_ISSUER,
+            options={'verify_aud': False}
+        )
+
+        # Access tokens carry the app client in client_id; ID tokens in aud
+        client_id = claims.get('client_id') or claims.get('aud')
+        if USER_POOL_CLIENT_ID and client_id != USER_POOL_CLIENT_ID:
+            logger.warning("Token was issued for a different app client")
+            return None
+
+        return {
+            'user_id': claims.get('username') or claims.get('cognito:username') or claims.get('sub'),
+            'email': claims.get('email'),
+            'email_verified': claims.get('email_verified') is True,
+            'session_id': None,  # Will be generated later
+            'auth_method': 'cognito',
+            'exp': claims.get('exp')
+        }
+
+    except jwt.ExpiredSignatureError:
+        logger.warning("Cognito token has expired")
+        return None
+    except jwt.InvalidTokenError as e:
+        logger.warning(f"Invalid Cognito token: {str(e)}")
+        return None
+    except Exception as e:
+        logger.error(f"Local Cognito validation unavailable, falling back to get_user: {str(e)}")
+        return validate_cognito_token_remote(token)
+
+def validate_cognito_token_remote(token: str) -> Optional[Dict[str, Any]]:
+    """Validate Cognito token via the get_user API (network round-trip)."""
     try:
         # Get Cognito user info
         response = cognito_client.get_user(AccessToken=token)
-        
+
         # Extract user attributes
         user_attributes = {attr['Name']: attr['Value'] for attr in response['UserAttributes']}
-        
+
         return {
             'user_id': response['Username'],
             'email': user_attributes.get('email'),
@@ -138,7 +214,7 @@ def validate_cognito_token(token: str) -> Optional[Dict[str, Any]]:
             'auth_method': 'cognito',
             'exp': None  # Cognito handles expiration
         }
-        
+
     except cognito_client.exceptions.NotAuthorizedException:
         logger.warning("Cognito token is invalid or expired")
         return None
@@ -148,10 +224,11 @@ def validate_cognito_token(token: str) -> Optional[Dict[str, Any]]:
 
 def validate_custom_jwt(token: str) -> Optional[Dict[str, Any]]:
     """Validate custom JWT token using secret from AWS Secrets Manager."""
+    import jwt
+
     try:
-        # Get JWT secret from Secrets Manager
-        secret_response = secrets_client.get_secret_value(SecretId=JWT_SECRET_ARN)
-        secret_data = json.loads(secret_response['SecretString'])
+        # Get JWT secret from Secrets Manager (cached across warm invocations)
+        secret_data = json.loads(get_cached_secret(JWT_SECRET_ARN))
         
         jwt_secret = secret_data.get('secret')
         algorithm = secret_data.get('algorithm', 'HS256')
@@ -205,5 +282,5 @@ def generate_policy(effect: str, resource: str, context: Dict[str, Any]) -> Dict
         'context': context
     }
     
-    logger.info(f"Generated policy: {json.dumps(policy, default=str)}")
+    logger.debug("Generated policy: %s", policy)
     return policy
\ No newline at end of file
@@ -1,38 +1,68 @@
 import json
+import logging
 import boto3
 import os
+import time
 from datetime import datetime
 from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+
+# Configure logging; DEBUG enables per-event and per-frame tracing
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Pool for overlapping independent network calls within one invocation
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Keep-alive sockets are reused across warm invocations
+boto_config = Config(tcp_keepalive=True, max_pool_connections=10,
+                     retries={'max_attempts': 2, 'mode': 'standard'})
 
 # Initialize AWS services
-dynamodb = boto3.resource('dynamodb')
-stepfunctions = boto3.client('stepfunctions')
-apigatewaymanagementapi = None  # Will be initialized per request
+dynamodb = boto3.resource('dynamodb', config=boto_config)
+stepfunctions = boto3.client('stepfunctions', config=boto_config)
 
 # Environment variables
 CONNECTIONS_TABLE_NAME = os.environ.get('CONNECTIONS_TABLE_NAME', 'causal-analysis-dev-connections')
 SESSIONS_TABLE_NAME = os.environ.get('SESSIONS_TABLE_NAME', 'causal-analysis-dev-sessions')
 STATE_MACHINE_ARN = os.environ.get('STATE_MACHINE_ARN')
 
+# Table handles resolved once per container
+connections_table = dynamodb.Table(CONNECTIONS_TABLE_NAME)
+sessions_table = dynamodb.Table(SESSIONS_TABLE_NAME)
+
+# Management API clients cached per endpoint so warm containers reuse
+# the HTTPS connection pool across invocations
+_mgmt_clients = {}
+apigatewaymanagementapi = None  # Set per invocation from the cache
+
+def _get_mgmt_client(endpoint_url):
+    client = _mgmt_clients.get(endpoint_url)
+    if client is None:
+        client = boto3.client('apigatewaymanagementapi',
+                              endpoint_url=endpoint_url,
+                              config=boto_config)
+        _mgmt_clients[endpoint_url] = client
+    return client
+
 def lambda_handler(event, context):
     """
     AWS API Gateway WebSocket Lambda handler.
     Handles $connect, $disconnect, and message routing.
     """
     try:
-        print(f"WebSocket Event: {json.dumps(event, default=str)}")
+        # Lazy debug logging: the event is only serialized when DEBUG is enabled
+        logger.debug("WebSocket Event: %s", event)
         
         route_key = event.get('requestContext', {}).get('routeKey')
         connection_id = event.get('requestContext', {}).get('connectionId')
         domain_name = event.get('requestContext', {}).get('domainName')
         stage = event.get('requestContext', {}).get('stage')
         
-        # Initialize API Gateway Management API client
+        # Look up the (cached) API Gateway Management API client
         global apigatewaymanagementapi
-        apigatewaymanagementapi = boto3.client(
-            'apigatewaymanagementapi',
-            endpoint_url=f"https://{domain_name}/{stage}"
-        )
+        apigatewaymanagementapi = _get_mgmt_client(f"https://{domain_name}/{stage}")
         
         if route_key == '$connect':
             return handle_connect(event, context)
@@ -41,14 +71,14 @@ def lambda_handler(event, context):
         elif route_key == '$default' or route_key == 'sendMessage':
             return handle_message(event, context)
         else:
-            print(f"Unknown route: {route_key}")
+            logger.warning("Unknown route: %s", route_key)
             return {
                 'statusCode': 400,
                 'body': json.dumps({'error': f'Unknown route: {route_key}'})
             }
             
     except Exception as e:
-        print(f"Lambda handler error: {str(e)}")
+        logger.error("Lambda handler error: %s", e)
         return {
             'statusCode': 500,
             'body': json.dumps({'error': 'Internal server error'})
@@ -69,12 +99,11 @@ def handle_connect(event, context):
     email = authorizer_context.get('email')
     session_id = authorizer_context.get('sessionId') or str(uuid4())
     
-    print(f"New connection: {connection_id}, User: {user_id}")
+    logger.info("New connection: %s, User: %s", connection_id, user_id)
     
     try:
         # Store connection in DynamoDB
-        connections_table = dynamodb.Table(CONNECTIONS_TABLE_NAME)
-        ttl = int(datetime.now().timestamp()) + (24 * 60 * 60)  # 24 hours
+        ttl = int(time.time()) + (24 * 60 * 60)  # 24 hours
         
         connections_table.put_item(
             Item={
@@ -82,7 +111,7 @@ def handle_connect(event, context):
                 'userId': user_id,
                 'email': email,
                 'sessionId': session_id,
-                'connectedAt': int(datetime.now().timestamp() * 1000),
+                'connectedAt': int(time.time() * 1000),
                 'ttl': ttl,
                 'status': 'connected',
                 'authenticated': True
@@ -98,12 +127,12 @@ def handle_connect(event, context):
             'message': 'Connected successfully'
         })
         
-        print(f"Connection {connection_id} stored successfully")
+        logger.debug("Connection %s stored successfully", connection_id)
         
         return {'statusCode': 200}
         
     except Exception as e:
-        print(f"Error handling connection: {str(e)}")
+        logger.error("Error handling connection: %s", e)
         return {
             'statusCode': 500,
             'body': json.dumps({'error': 'Failed to establish connection'})
@@ -113,21 +142,20 @@ def handle_disconnect(event, context):
     """Handle WebSocket disconnections."""
     connection_id = event['requestContext']['connectionId']
     
-    print(f"Disconnection: {connection_id}")
+    logger.info("Disconnection: %s", connection_id)
     
     try:
         # Remove connection from DynamoDB
-        connections_table = dynamodb.Table(CONNECTIONS_TABLE_NAME)
         connections_table.delete_item(
             Key={'connectionId': connection_id}
         )
         
-        print(f"Connection {connection_id} removed successfully")
+        logger.debug("Connection %s removed successfully", connection_id)
         
         return {'statusCode': 200}
         
     except Exception as e:
-        print(f"Error handling disconnection: {str(e)}")
+        logger.error("Error handling disconnection: %s", e)
         return {'statusCode': 200}  # Return success even if cleanup fails
 
 def handle_message(event, context):
@@ -139,10 +167,9 @@ def handle_message(event, context):
         body = json.loads(event.get('body', '{}'))
         action = body.get('action')
         
-        print(f"Message from {connection_id}: {action}")
+        logger.debug("Message from %s: %s", connection_id, action)
         
         # Get connection info
-        connections_table = dynamodb.Table(CONNECTIONS_TABLE_NAME)
         connection_response = connections_table.get_item(
             Key={'connectionId': connection_id}
         )
@@ -164,7 +191,7 @@ def handle_message(event, context):
         elif action == 'ping':
             send_to_connection(connection_id, {
                 'action': 'pong',
-                'timestamp': int(datetime.now().timestamp() * 1000)
+                'timestamp': int(time.time() * 1000)
             })
             return {'statusCode': 200}
         else:
@@ -181,7 +208,7 @@ def handle_message(event, context):
         })
         return {'statusCode': 400}
     except Exception as e:
-        print(f"Error handling message: {str(e)}")
+        logger.error("Error handling message: %s", e)
         send_to_connection(connection_id, {
             'action': 'error',
             'error': 'Internal server error'
@@ -197,10 +224,11 @@ def handle_query(connection_id, connection_info, body):
         query_payload = body.get('payload')
         message_id = body.get('messageId', str(uuid4()))
         
-        print(f"Processing query for user {user_id}, session {session_id}")
+        logger.debug("Processing query for user %s, session %s", user_id, session_id)
         
-        # Acknowledge query receipt
-        send_to_connection(connection_id, {
+        # Acknowledge query receipt on the pool so the ack frame and
+        # StartExecution overlap instead of summing their round-trips
+        ack_future = _EXECUTOR.submit(send_to_connection, connection_id, {
             'action': 'query_received',
             'messageId': message_id,
             'sessionId': session_id,
@@ -208,7 +236,7 @@ def handle_query(connection_id, connection_info, body):
         })
         
         # Start Step Functions execution
-        execution_name = f"exec-{session_id}-{int(datetime.now().timestamp())}"
+        execution_name = f"exec-{session_id}-{int(time.time())}"
         
         step_input = {
             'sessionId': session_id,
@@ -231,26 +259,34 @@ def handle_query(connection_id, connection_info, body):
             input=json.dumps(step_input)
         )
         
-        print(f"Started execution: {response['executionArn']}")
+        logger.debug("Started execution: %s", response['executionArn'])
         
-        # Store execution info in session
-        sessions_table = dynamodb.Table(SESSIONS_TABLE_NAME)
-        sessions_table.put_item(
-            Item={
-                'sessionId': session_id,
-                'userId': user_id,
-                'connectionId': connection_id,
-                'executionArn': response['executionArn'],
-                'messageId': message_id,
-                'createdAt': int(datetime.now().timestamp() * 1000),
-                'status': 'processing'
-            }
+        # Store execution info in session; an upsert touches only these
+        # attributes instead of replacing the whole item, so fields
+        # written by the workflow Lambdas (context, pending prompts)
+        # survive a follow-up query on the same session
+        sessions_table.update_item(
+            Key={'sessionId': session_id},
+            UpdateExpression='SET userId = :u, connectionId = :c, executionArn = :e, messageId = :m, createdAt = :t, #s = :s',
+            ExpressionAttributeNames={'#s': 'status'},
+            ExpressionAttributeValues={
+                ':u': user_id,
+                ':c': connection_id,
+                ':e': response['executionArn'],
+                ':m': message_id,
+                ':t': int(time.time() * 1000),
+                ':s': 'processing'
+            },
+            ReturnValues='NONE'
         )
-        
+
+        # Surface ack-delivery failures before reporting success
+        ack_future.result()
+
         return {'statusCode': 200}
         
     except Exception as e:
-        print(f"Error handling query: {str(e)}")
+        logger.error("Error handling query: %s", e)
         send_to_connection(connection_id, {
             'action': 'error',
             'messageId': body.get('messageId'),
@@ -272,7 +308,6 @@ def handle_user_response(connection_id, connection_info, body):
             return {'statusCode': 400}
         
         # Get session info
-        sessions_table = dynamodb.Table(SESSIONS_TABLE_NAME)
         session_response = sessions_table.get_item(
             Key={'sessionId': session_id}
         )
@@ -308,7 +343,7 @@ def handle_user_response(connection_id, connection_info, body):
         sessions_table.update_item(
             Key={'sessionId': session_id},
             UpdateExpression='REMOVE pendingTaskToken, pendingPrompt',
-            ReturnValues='UPDATED_NEW'
+            ReturnValues='NONE'
         )
         
         send_to_connection(connection_id, {
@@ -319,7 +354,7 @@ def handle_user_response(connection_id, connection_info, body):
         return {'statusCode': 200}
         
     except Exception as e:
-        print(f"Error handling user response: {str(e)}")
+        logger.error("Error handling user response: %s", e)
         send_to_connection(connection_id, {
             'action': 'error',
             'error': f'Failed to process response: {str(e)}'
@@ -333,15 +368,14 @@ def send_to_connection(connection_id, message):
             ConnectionId=connection_id,
             Data=json.dumps(message).encode('utf-8')
         )
-        print(f"Message sent to {connection_id}: {message.get('action')}")
+        logger.debug("Message sent to %s: %s", connection_id, message.get('action'))
     except apigatewaymanagementapi.exceptions.GoneException:
-        print(f"Connection {connection_id} is gone")
+        logger.info("Connection %s is gone", connection_id)
         # Connection is stale, remove from database
         try:
-            connections_table = dynamodb.Table(CONNECTIONS_TABLE_NAME)
             connections_table.delete_item(Key={'connectionId': connection_id})
         except Exception as e:
-            print(f"Error removing stale connection: {str(e)}")
+            logger.error("Error removing stale connection: %s", e)
     except Exception as e:
-        print(f"Error sending message to {connection_id}: {str(e)}")
+        logger.error("Error sending message to %s: %s", connection_id, e)
         raise
\ No newline at end of file
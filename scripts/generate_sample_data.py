@@ -4,8 +4,36 @@ Generate sample datasets for testing the causal analysis pipeline.
 """
 
 import os
+import numpy as np
 from causal_analysis.data.utils import generate_sample_dataset
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+
+def save_csv(data, filename):
+    """Write a DataFrame to CSV, specializing on the (fixed) schema.
+
+    All generated datasets share one numeric layout, so a row format
+    string built once from the dtypes lets numpy's C printf loop write
+    the file instead of pandas' generic per-cell formatter. Non-numeric
+    frames fall back to Arrow's vectorized writer (or plain to_csv).
+    """
+    if all(dt.kind in 'iuf' for dt in data.dtypes):
+        fmt = ','.join(
+            '%d' if dt.kind in 'iu' else '%.6g'
+            for dt in data.dtypes
+        )
+        np.savetxt(filename, data.to_numpy(), fmt=fmt,
+                   header=','.join(data.columns), comments='')
+    elif pa is not None:
+        pa_csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), filename)
+    else:
+        data.to_csv(filename, index=False)
+
 def main():
     """Generate and save sample datasets."""
     
@@ -54,7 +82,7 @@ def main():
         
         # Save to CSV
         filename = f"sample_data/{dataset_config['name']}.csv"
-        data.to_csv(filename, index=False)
+        save_csv(data, filename)
         
         print(f"  Saved to {filename}")
         print(f"  Description: {dataset_config['description']}")
@@ -115,7 +115,8 @@ def run_eda_analysis(dataset_info: Dict) -> Dict:
             # Count generated files
             output_dir = Path(f"eda_output_{dataset_info['name']}")
             if output_dir.exists():
-                plots = list(output_dir.glob("*.png"))
+                # Figures are WebP when Pillow supports it, PNG otherwise
+                plots = list(output_dir.glob("*.webp")) + list(output_dir.glob("*.png"))
                 result["plots_generated"] = len(plots)
                 print(f"  📊 Generated {len(plots)} plots")
                 